@@ -20,6 +20,9 @@ from core.config import settings
 from utils.main_scrapper import main_scrapper
 from utils.file_storage import JobFileManager, TaskStorage
 from utils.convert_json_to_csv import read_all_jobs_from_files, generate_csv_from_jobs
+from utils.logging import setup_logger
+
+logger = setup_logger(__name__)
 
 # ============================================================================
 # APP INITIALIZATION
@@ -212,7 +215,10 @@ async def process_urls_with_agent(
         # Check if task was cancelled before starting new URL
         task_data = tasks_db.get(task_id)
         if task_data and task_data.get("cancelled", False):
-            print(f"[Agent {agent_id}] Task {task_id} was cancelled, stopping immediately...")
+            logger.info(
+                "Task cancelled, agent stopping",
+                extra={"agent_id": agent_id, "task_id": task_id},
+            )
             return
         
         result = {
@@ -226,20 +232,29 @@ async def process_urls_with_agent(
         domain = extract_domain(url)
         
         try:
-            print(f"[Agent {agent_id}] Processing: {domain}")
+            logger.info(
+                "Agent processing domain",
+                extra={"agent_id": agent_id, "task_id": task_id, "domain": domain},
+            )
             
             # Run scraper (this will be cancelled if task is cancelled)
             jobs_response = await main_scrapper(domain=domain, agent_id=agent_id, llm_model="gpt-5-nano")
             all_scraped_jobs = jobs_response.get("job_found", [])
             if not all_scraped_jobs:
                 file_manager.add_job(jobs_response)
-                print("NO job found on this page")
+                logger.info(
+                    "No job found on this page",
+                    extra={"agent_id": agent_id, "domain": domain},
+                )
                 return
             
             # Check cancellation again before saving
             task_data = tasks_db.get(task_id)
             if task_data and task_data.get("cancelled", False):
-                print(f"[Agent {agent_id}] Task {task_id} cancelled during scraping, stopping...")
+                logger.info(
+                    "Task cancelled during scraping, agent stopping",
+                    extra={"agent_id": agent_id, "task_id": task_id, "domain": domain},
+                )
                 return
             
             # Save jobs
@@ -256,17 +271,27 @@ async def process_urls_with_agent(
                 
         except asyncio.CancelledError:
             # Task was cancelled, clean exit
-            print(f"[Agent {agent_id}] Task {task_id} cancelled while processing {domain}")
+            logger.info(
+                "Task cancelled while processing domain",
+                extra={"agent_id": agent_id, "task_id": task_id, "domain": domain},
+            )
             raise  # Re-raise to propagate cancellation
             
         except Exception as e:
             # Check if cancelled during error handling
             task_data = tasks_db.get(task_id)
             if task_data and task_data.get("cancelled", False):
-                print(f"[Agent {agent_id}] Task cancelled, not recording error for {domain}")
+                logger.info(
+                    "Task cancelled, not recording error",
+                    extra={"agent_id": agent_id, "task_id": task_id, "domain": domain},
+                )
                 return
             
-            print(f"[Agent {agent_id}] Error processing {domain}: {str(e)}")
+            logger.error(
+                "Agent failed processing domain",
+                extra={"agent_id": agent_id, "task_id": task_id, "domain": domain, "error": str(e)},
+                exc_info=True,
+            )
             task_data = tasks_db.get(task_id)
             if task_data:
                 task_data["failed_urls"].append(domain)
@@ -322,7 +347,10 @@ async def run_scraping_task(task_id: str, urls: List[str], num_agents: int, max_
             # Run agents in parallel
             await asyncio.gather(*agent_tasks)
         except asyncio.CancelledError:
-            print(f"Task {task_id} was cancelled, cleaning up...")
+            logger.info(
+                "Task cancelled, cleaning up agents",
+                extra={"task_id": task_id},
+            )
             # Cancel all agent tasks
             for task in agent_tasks:
                 if not task.done():
@@ -649,7 +677,10 @@ async def cancel_task(task_id: str):
             if not agent_task.done():
                 agent_task.cancel()
                 cancelled_agents += 1
-        print(f"Cancelled {cancelled_agents} running agent(s) for task {task_id}")
+        logger.info(
+            "Cancelled running agents",
+            extra={"task_id": task_id, "cancelled_agents": cancelled_agents},
+        )
     
     return {
         "task_id": task_id,
@@ -1,5 +1,9 @@
 import asyncio
+import hashlib
 import json
+import re
+import sys
+from collections import OrderedDict
 from enum import Enum
 from typing import Any, Optional
 from playwright.async_api import  Page
@@ -10,6 +14,45 @@ from utils.logging import setup_logger
 # Configure logging
 logger = setup_logger(__name__)
 
+# Precompiled patterns/prefixes for the per-text-node label checks
+_TIME_RE = re.compile(r'^\d{1,2}:\d{2}')
+_URL_PREFIXES = ("http:", "https:", "ftp:", "//")
+# Words that, followed by a space, open a sentence rather than a label/value
+_SENTENCE_STARTERS = frozenset({
+    "this", "that", "these", "those", "there", "here",
+    "it", "he", "she", "they", "we", "i", "you",
+    "the", "a", "an", "my", "your", "his", "her", "our", "their",
+    "if", "when", "while", "after", "before", "because", "since",
+    "what", "how", "why", "where", "who", "which",
+})
+_VALUE_SENTENCE_STARTERS = frozenset({
+    "it", "this", "that", "these", "those", "there",
+    "here", "he", "she", "they", "we", "i", "you",
+})
+_SENTENCE_PUNCT_TABLE = str.maketrans("", "", ".!?")
+_SENTENCE_VERB_RE = re.compile(
+    r' (?:is|are|was|were|has|have|had|will|would|should|could|can) '
+)
+
+# Number of structured extraction results kept per extractor, keyed by DOM fingerprint
+_STRUCTURED_RESULT_CACHE_SIZE = 128
+
+
+def _norm_label(label: str) -> str:
+    """Strip a trailing colon and collapse internal whitespace to single spaces."""
+    return " ".join(label.rstrip(":").split())
+
+
+def _norm(text: str) -> str:
+    """Normalized form used for extracted_texts membership."""
+    return text.lower().strip()
+
+
+def _starts_with_word(text: str, words: frozenset[str]) -> bool:
+    """Check if text opens with one of words followed by a space."""
+    first, sep, _ = text.partition(" ")
+    return bool(sep) and first in words
+
 
 from dataclasses import dataclass, field
 
@@ -22,6 +65,21 @@ class StructuredSection:
     subsections: list["StructuredSection"] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class FlatElement:
+    """A significant element from the flattened DOM, consumed by section building."""
+    kind: str  # heading, bold_header, paragraph, text, list, line_break, key_value_extracted, scope_end
+    text: str = ""  # for key_value_extracted, the label
+    items: Optional[list[str]] = None
+    level: int = 0
+    scoped: bool = False
+    inline_emphasis: bool = False
+    norm: str = field(init=False)  # text in extracted_texts key form
+
+    def __post_init__(self) -> None:
+        self.norm = _norm(self.text)
+
+
 # =============================================================================
 # DOM Content Extractor
 # =============================================================================
@@ -98,6 +156,10 @@ class DOMContentExtractor:
         "benefits", "perks", "reports to", "manager", "supervisor",
         "travel", "travel required",
     })
+    # Single-pass matchers for COMMON_JOB_LABELS substring checks in either direction:
+    # "label in text" via one alternation, "text in label" via a NUL-separated blob.
+    _COMMON_JOB_LABELS_RE = re.compile("|".join(map(re.escape, sorted(COMMON_JOB_LABELS))))
+    _COMMON_JOB_LABELS_BLOB = "\0".join(sorted(COMMON_JOB_LABELS))
 
     COMMON_SECTION_HEADINGS = frozenset({
         "job summary", "summary", "overview", "about the role", "about this role",
@@ -117,6 +179,9 @@ class DOMContentExtractor:
         "closing date", "application deadline",
         "additional information", "other information", "notes",
     })
+    # Same single-pass matchers as for COMMON_JOB_LABELS
+    _COMMON_SECTION_HEADINGS_RE = re.compile("|".join(map(re.escape, sorted(COMMON_SECTION_HEADINGS))))
+    _COMMON_SECTION_HEADINGS_BLOB = "\0".join(sorted(COMMON_SECTION_HEADINGS))
 
     # Cookie consent button selectors (ordered by specificity)
     COOKIE_SELECTORS = [
@@ -314,6 +379,20 @@ class DOMContentExtractor:
     def __init__(self, page: Page, config: Optional[ExtractionConfig] = None):
         self._page = page
         self._config = config or ExtractionConfig()
+        # Flat pre-order index of the tree being extracted (see _prepare_tree)
+        self._flat_nodes: list[dict[str, Any]] = []
+        self._flat_tags: list[str] = []
+        self._flat_ends: list[int] = []
+        self._flat_position: dict[int, int] = {}
+        self._flat_inner_counts: list[int] = [0]
+        self._scanned_div_parents: set[int] = set()
+        # Per-extraction memos keyed by node id, cleared after each _extract_structured_data
+        self._text_cache: dict[int, str] = {}
+        self._list_items_cache: dict[int, list[str]] = {}
+        # Per-extraction memos for the pure text predicates, keyed by the text itself
+        self._label_cache: dict[str, bool] = {}
+        self._heading_cache: dict[str, bool] = {}
+        self._structured_result_cache: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
         logger.debug(
             "DOMContentExtractor initialized",
             extra={
@@ -716,13 +795,15 @@ class DOMContentExtractor:
         logger.debug("Processing table node")
         rows: list[dict[str, Any]] = []
 
-        def find_rows(node: dict[str, Any]) -> None:
+        # Iterative pre-order walk, so rows keep document order without recursion
+        stack = [table_node]
+        while stack:
+            node = stack.pop()
             if node.get("tag") == "tr":
                 rows.append(node)
-            for child in node.get("children", []):
-                find_rows(child)
-
-        find_rows(table_node)
+            children = node.get("children")
+            if children:
+                stack.extend(reversed(children))
 
         if not rows:
             logger.debug("No rows found in table")
@@ -1185,95 +1266,203 @@ class DOMContentExtractor:
         """
         Extract page content into structured dictionary.
         Returns both key-value pairs and sectioned content.
+        Results are cached by DOM fingerprint, so re-extracting an unchanged page is cheap.
         """
+        fingerprint = self._fingerprint(node)
+        cached = self._structured_result_cache.get(fingerprint)
+        if cached is not None:
+            self._structured_result_cache.move_to_end(fingerprint)
+            return self._copy_structured_result(cached)
+        
+        structured = self._extract_structured_data(node)
+        self._structured_result_cache[fingerprint] = self._copy_structured_result(structured)
+        if len(self._structured_result_cache) > _STRUCTURED_RESULT_CACHE_SIZE:
+            self._structured_result_cache.popitem(last=False)
+        return structured
+
+    def _extract_structured_data(self, node: dict[str, Any]) -> dict[str, Any]:
+        """Run all extraction phases over the DOM (uncached)."""
         result: dict[str, Any] = {}
         extracted_texts: set[str] = set()  # Track what's been extracted
         
-        # Phase 1: Extract explicit key-value patterns
-        self._extract_definition_lists(node, result, extracted_texts)
-        self._extract_table_pairs(node, result, extracted_texts)
-        self._extract_inline_label_values(node, result, extracted_texts)
-        
-        # Phase 2: Extract sectioned content (headings + bold pseudo-headings)
-        sections = self._extract_all_sections(node, extracted_texts)
-        
-        # Phase 3: Merge sections into result
-        for section in sections:
-            self._merge_section_to_result(section, result, extracted_texts)
-        
-        # Phase 4: Capture any remaining content not yet structured
-        self._extract_remaining_content(node, result, extracted_texts)
-        
-        return self._cleanup_structured_result(result)
+        # Intern tag names and build the flat pre-order index of the tree
+        self._prepare_tree(node)
+        try:
+            # Phase 1: Extract explicit key-value patterns
+            self._extract_definition_lists(result, extracted_texts)
+            self._extract_table_pairs(result, extracted_texts)
+            self._extract_inline_label_values(node, result, extracted_texts)
+            
+            # Phase 2: Extract sectioned content (headings + bold pseudo-headings)
+            sections = self._extract_all_sections(node, extracted_texts)
+            
+            # Phase 3: Merge sections into result
+            for section in sections:
+                self._merge_section_to_result(section, result, extracted_texts)
+            
+            # Phase 4: Capture any remaining content not yet structured
+            self._extract_remaining_content(node, result, extracted_texts)
+            
+            return self._cleanup_structured_result(result)
+        finally:
+            # Drop the index and memos so the extractor doesn't keep this DOM alive
+            self._reset_extraction_state()
+
+    def _reset_extraction_state(self) -> None:
+        """Clear the flat tree index and the per-extraction memos."""
+        self._flat_nodes = []
+        self._flat_tags = []
+        self._flat_ends = []
+        self._flat_position = {}
+        self._flat_inner_counts = [0]
+        self._scanned_div_parents = set()
+        self._text_cache = {}
+        self._list_items_cache = {}
+        self._label_cache = {}
+        self._heading_cache = {}
+
+    def _fingerprint(self, node: dict[str, Any]) -> bytes:
+        """Hash every field the extractor reads (tag, text, innerText, nesting)."""
+        parts = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current is None:
+                parts.append(")")
+                continue
+            if not isinstance(current, dict):
+                parts.append("()")
+                continue
+            # repr() quotes and escapes each field, so no text can forge a field or node boundary
+            parts.append(repr((current.get("tag", ""), current.get("text", ""), current.get("innerText", ""))))
+            # None closes this node once all of its children have been emitted
+            stack.append(None)
+            stack.extend(reversed(current.get("children") or ()))
+        return hashlib.blake2b("".join(parts).encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    @staticmethod
+    def _copy_structured_result(result: dict[str, Any]) -> dict[str, Any]:
+        """Copy a result deeply enough to be independent (values are str or list)."""
+        return {k: list(v) if isinstance(v, list) else v for k, v in result.items()}
+
+    def _prepare_tree(self, node: dict[str, Any]) -> None:
+        """
+        Intern every node's tag in place and index the tree in document (pre-)order
+        as parallel lists: nodes, tags, and the position just past each node's subtree.
+        """
+        nodes = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if not current or not isinstance(current, dict):
+                continue
+            tag = current.get("tag")
+            if tag:
+                current["tag"] = sys.intern(tag)
+            nodes.append(current)
+            stack.extend(reversed(current.get("children") or ()))
+        
+        # A subtree ends where its last indexed child's subtree ends; walk backwards so
+        # every child is resolved before its parent
+        position = {id(n): i for i, n in enumerate(nodes)}
+        ends = [0] * len(nodes)
+        for i in range(len(nodes) - 1, -1, -1):
+            end = i + 1
+            for child in reversed(nodes[i].get("children") or ()):
+                j = position.get(id(child))
+                if j is not None:
+                    end = ends[j]
+                    break
+            ends[i] = end
+        
+        self._flat_nodes = nodes
+        self._flat_tags = [n.get("tag", "") for n in nodes]
+        self._flat_ends = ends
+        self._flat_position = position
+        # Running count of nodes carrying innerText; a subtree's count is a difference
+        inner_counts = [0]
+        for n in nodes:
+            inner_counts.append(inner_counts[-1] + ("innerText" in n))
+        self._flat_inner_counts = inner_counts
 
     # =========================================================================
     # Phase 1: Explicit Key-Value Extraction
     # =========================================================================
 
-    def _extract_definition_lists(self, node: dict[str, Any], result: dict[str, Any], extracted_texts: set[str]) -> None:
-        """Extract from <dl><dt>Label</dt><dd>Value</dd></dl> patterns."""
-        if not node or not isinstance(node, dict):
-            return
-        
-        tag = node.get("tag", "")
-        
-        if tag == "dl":
-            children = node.get("children", [])
-            i = 0
-            while i < len(children):
-                child = children[i]
-                if child.get("tag") == "dt":
-                    label = self._get_node_text(child)
-                    # Look for dd (might not be immediately after)
-                    j = i + 1
-                    while j < len(children) and children[j].get("tag") not in ("dt", "dd"):
-                        j += 1
-                    if j < len(children) and children[j].get("tag") == "dd":
-                        value = self._get_text_or_list(children[j])
-                        if label and value:
-                            self._add_to_result(result, label, value)
-                            # Track extracted content
-                            extracted_texts.add(label.lower().strip())
-                            if isinstance(value, str):
-                                extracted_texts.add(value.lower().strip())
-                            elif isinstance(value, list):
-                                for v in value:
-                                    extracted_texts.add(v.lower().strip())
-                        i = j + 1
-                        continue
-                i += 1
-            return
-        
-        for child in node.get("children", []):
-            self._extract_definition_lists(child, result, extracted_texts)
+    def _extract_definition_lists(self, result: dict[str, Any], extracted_texts: set[str]) -> None:
+        """Extract from <dl><dt>Label</dt><dd>Value</dd></dl> patterns (nested dl are not revisited)."""
+        tags, nodes, ends = self._flat_tags, self._flat_nodes, self._flat_ends
+        i = 0
+        while True:
+            try:
+                i = tags.index("dl", i)
+            except ValueError:
+                return
+            self._extract_definition_list_pairs(nodes[i], result, extracted_texts)
+            i = ends[i]
 
-    def _extract_table_pairs(self, node: dict[str, Any], result: dict[str, Any], extracted_texts: set[str]) -> None:
+    def _extract_definition_list_pairs(self, node: dict[str, Any], result: dict[str, Any], extracted_texts: set[str]) -> None:
+        """Extract dt/dd pairs from a single <dl>."""
+        children = node.get("children") or ()
+        i = 0
+        while i < len(children):
+            child = children[i]
+            if child.get("tag") == "dt":
+                label = self._get_node_text(child)
+                # Look for dd (might not be immediately after)
+                j = i + 1
+                while j < len(children) and children[j].get("tag") not in ("dt", "dd"):
+                    j += 1
+                if j < len(children) and children[j].get("tag") == "dd":
+                    value = self._get_text_or_list(children[j])
+                    if label and value:
+                        self._add_to_result(result, label, value)
+                        self._track_extracted_pair(extracted_texts, label, value)
+                    i = j + 1
+                    continue
+            i += 1
+
+    def _extract_table_pairs(self, result: dict[str, Any], extracted_texts: set[str]) -> None:
         """Extract from table rows with label-value pattern."""
-        if not node or not isinstance(node, dict):
-            return
-        
-        tag = node.get("tag", "")
-        
-        if tag == "tr":
-            children = node.get("children", [])
-            cells = [c for c in children if c.get("tag") in self.TABLE_CELL_TAGS]
-            
-            if len(cells) == 2:
-                label = self._get_node_text(cells[0])
-                value = self._get_text_or_list(cells[1])
-                if label and value and self._is_likely_label(label):
-                    self._add_to_result(result, label, value)
-                    # Track extracted content
-                    extracted_texts.add(label.lower().strip())
-                    if isinstance(value, str):
-                        extracted_texts.add(value.lower().strip())
-                    elif isinstance(value, list):
-                        for v in value:
-                            extracted_texts.add(v.lower().strip())
-                    return
+        tags, nodes, ends = self._flat_tags, self._flat_nodes, self._flat_ends
+        i = 0
+        while True:
+            try:
+                i = tags.index("tr", i)
+            except ValueError:
+                return
+            # A row taken as a pair is not searched further; otherwise look inside it too
+            if self._extract_table_row_pair(nodes[i], result, extracted_texts):
+                i = ends[i]
+            else:
+                i += 1
+
+    def _extract_table_row_pair(self, node: dict[str, Any], result: dict[str, Any], extracted_texts: set[str]) -> bool:
+        """Extract a label-value pair from a two-cell <tr>. Returns True if one was taken."""
+        # Only two-cell rows are pairs, so stop collecting once a third cell shows up
+        cells = []
+        for c in node.get("children") or ():
+            if c.get("tag") in self.TABLE_CELL_TAGS:
+                cells.append(c)
+                if len(cells) > 2:
+                    break
         
-        for child in node.get("children", []):
-            self._extract_table_pairs(child, result, extracted_texts)
+        if len(cells) == 2:
+            label = self._get_node_text(cells[0])
+            value = self._get_text_or_list(cells[1])
+            if label and value and self._is_likely_label(label):
+                self._add_to_result(result, label, value)
+                self._track_extracted_pair(extracted_texts, label, value)
+                return True
+        return False
+
+    def _track_extracted_pair(self, extracted_texts: set[str], label: str, value: Any) -> None:
+        """Record a label and its str/list value as extracted."""
+        extracted_texts.add(_norm(label))
+        if isinstance(value, str):
+            extracted_texts.add(_norm(value))
+        elif isinstance(value, list):
+            extracted_texts.update(map(_norm, value))
 
             
 
@@ -1283,19 +1472,16 @@ class DOMContentExtractor:
     def _is_key_value_text(self, text: str) -> bool:
         """
         Determine if text is a key-value pair vs a regular sentence or URL.
+        Callers must already have checked that text contains a colon.
         """
-        if not text or ":" not in text:
-            return False
-        
         text_lower = text.lower().strip()
         
         # Skip URLs
-        if text_lower.startswith(("http:", "https:", "ftp:", "//")):
+        if text_lower.startswith(_URL_PREFIXES):
             return False
         
         # Skip time patterns like "12:00pm", "8:30"
-        import re
-        if re.match(r'^\d{1,2}:\d{2}', text):
+        if _TIME_RE.match(text):
             return False
         
         parts = text.split(":", 1)
@@ -1315,7 +1501,7 @@ class DOMContentExtractor:
             return False
         
         # Label shouldn't contain sentence-ending punctuation
-        if any(p in label for p in ".!?"):
+        if len(label.translate(_SENTENCE_PUNCT_TABLE)) != len(label):
             return False
         
         # Label shouldn't have too many words
@@ -1332,10 +1518,7 @@ class DOMContentExtractor:
             return False
         
         # If value starts with sentence patterns
-        value_lower = value.lower()
-        sentence_starters = ("it ", "this ", "that ", "these ", "those ", "there ", 
-                            "here ", "he ", "she ", "they ", "we ", "i ", "you ")
-        if any(value_lower.startswith(s) for s in sentence_starters):
+        if _starts_with_word(value.lower(), _VALUE_SENTENCE_STARTERS):
             return False
         
         # Short total text with reasonable label
@@ -1345,66 +1528,6 @@ class DOMContentExtractor:
         return False
 
 
-    def _is_likely_label(self, text: str) -> bool:
-        """Check if text looks like a field label, not a sentence or number."""
-        if not text:
-            return False
-        
-        text_clean = text.strip()
-        text_lower = text_clean.lower()
-        
-        # Reject pure numbers (like statistics "865,534")
-        if text_clean.replace(",", "").replace(".", "").isdigit():
-            return False
-        
-        # Reject URLs
-        if text_lower.startswith(("http", "https", "www", "//", "ftp")):
-            return False
-        
-        # Check against known labels first
-        for label in self.COMMON_JOB_LABELS:
-            if label in text_lower or text_lower in label:
-                return True
-        
-        # Reject sentence-like patterns
-        sentence_starters = (
-            "this ", "that ", "these ", "those ", "there ", "here ",
-            "it ", "he ", "she ", "they ", "we ", "i ", "you ",
-            "the ", "a ", "an ", "my ", "your ", "his ", "her ", "our ", "their ",
-            "if ", "when ", "while ", "after ", "before ", "because ", "since ",
-            "what ", "how ", "why ", "where ", "who ", "which ",
-        )
-        if any(text_lower.startswith(s) for s in sentence_starters):
-            return False
-        
-        # Reject if contains common verbs
-        sentence_verbs = (" is ", " are ", " was ", " were ", " has ", " have ", 
-                        " had ", " will ", " would ", " should ", " could ", " can ")
-        if any(v in text_lower for v in sentence_verbs):
-            return False
-        
-        # Short text with few words is more likely to be a label
-        words = text_clean.split()
-        if len(text_clean) < 40 and len(words) <= 4:
-            return True
-        
-        return False
-
-
-    def _should_skip_container(self, node: dict[str, Any]) -> bool:
-        """Check if this container should be skipped entirely (nav, header, footer, etc.)"""
-        if not node or not isinstance(node, dict):
-            return False
-        
-        tag = node.get("tag", "")
-        
-        # Skip navigation containers
-        if tag in self.SKIP_CONTAINER_TAGS:
-            return True
-        
-        return False
-
-
     def _extract_inline_label_values(
         self, 
         node: dict[str, Any], 
@@ -1424,7 +1547,7 @@ class DOMContentExtractor:
         children = node.get("children", [])
         
         # Skip navigation/header/footer containers entirely
-        if self._should_skip_container(node):
+        if tag in self.SKIP_CONTAINER_TAGS:
             return
         
         # Pattern 1: "Label: Value" in same text node
@@ -1434,9 +1557,8 @@ class DOMContentExtractor:
                 label, value = parts[0].strip(), parts[1].strip()
                 if label and value and self._is_likely_label(label):
                     self._add_to_result(result, label, value)
-                    extracted_texts.add(label.lower().strip())
-                    extracted_texts.add(value.lower().strip())
-                    extracted_texts.add(text.lower().strip())
+                    self._track_extracted_pair(extracted_texts, label, value)
+                    extracted_texts.add(_norm(text))
                     return
         
         # Pattern 2: <strong>Label:</strong> followed by value in same container
@@ -1444,11 +1566,10 @@ class DOMContentExtractor:
             kv = self._extract_bold_label_value_in_block(node)
             if kv:
                 self._add_to_result(result, kv[0], kv[1])
-                extracted_texts.add(kv[0].lower().strip())
-                extracted_texts.add(kv[1].lower().strip())
+                self._track_extracted_pair(extracted_texts, kv[0], kv[1])
                 full_text = self._get_node_text(node)
                 if full_text:
-                    extracted_texts.add(full_text.lower().strip())
+                    extracted_texts.add(_norm(full_text))
                 return
         
         # Pattern 3: <span>Label:</span><span>Value</span> as siblings
@@ -1468,18 +1589,20 @@ class DOMContentExtractor:
                         pass
                     elif next_sibling.get("tag") in self.INLINE_TAGS or not next_sibling.get("tag"):
                         self._add_to_result(result, label, next_text)
-                        extracted_texts.add(label.lower().strip())
-                        extracted_texts.add(next_text.lower().strip())
+                        self._track_extracted_pair(extracted_texts, label, next_text)
                         return
         
         # Pattern 4: Alternating <div>Label</div><div>Value</div> siblings
-        # This handles job metadata tables common in job sites
-        if tag == "div" and parent_children:
+        # This handles job metadata tables common in job sites.
+        # The scan covers the whole sibling list, so run it once per parent.
+        if tag == "div" and parent_children and id(parent_children) not in self._scanned_div_parents:
+            self._scanned_div_parents.add(id(parent_children))
             self._extract_alternating_div_pairs(parent_children, result, extracted_texts)
         
         # Recurse into children
+        recurse = self._extract_inline_label_values
         for i, child in enumerate(children):
-            self._extract_inline_label_values(child, result, extracted_texts, children, i)
+            recurse(child, result, extracted_texts, children, i)
 
 
     def _extract_alternating_div_pairs(
@@ -1492,6 +1615,7 @@ class DOMContentExtractor:
         Extract key-value pairs from alternating div siblings:
         <div>Label</div><div>Value</div><div>Label2</div><div>Value2</div>
         """
+        is_label = self._is_likely_label
         i = 0
         while i < len(children) - 1:
             current = children[i]
@@ -1509,8 +1633,8 @@ class DOMContentExtractor:
             # Next should have text that looks like a value (not a label)
             if (current_text 
                 and next_text 
-                and self._is_likely_label(current_text)
-                and not self._is_likely_label(next_text)
+                and is_label(current_text)
+                and not is_label(next_text)
                 and current_text.lower() not in extracted_texts):
                 
                 # Check current div has minimal children (often just an icon span)
@@ -1522,8 +1646,7 @@ class DOMContentExtractor:
                 
                 if len(current_children) <= 1 or has_only_empty_children:
                     self._add_to_result(result, current_text, next_text)
-                    extracted_texts.add(current_text.lower().strip())
-                    extracted_texts.add(next_text.lower().strip())
+                    self._track_extracted_pair(extracted_texts, current_text, next_text)
                     i += 2  # Skip both divs
                     continue
             
@@ -1597,11 +1720,11 @@ class DOMContentExtractor:
         elements = self._flatten_to_elements(node, extracted_texts)
         
         # Build sections from the flattened elements
-        sections = self._build_sections_from_elements(elements, extracted_texts)
+        sections = self._build_sections_from_elements(elements)
         
         return sections
 
-    def _flatten_to_elements(self, node: dict[str, Any], extracted_texts: set[str], depth: int = 0) -> list[dict]:
+    def _flatten_to_elements(self, node: dict[str, Any], extracted_texts: set[str]) -> list[FlatElement]:
         """
         Flatten DOM into a list of significant elements:
         - headings (h1-h6)
@@ -1612,94 +1735,93 @@ class DOMContentExtractor:
         
         Skips content that was already extracted as key-values.
         """
-        elements = []
-        
-        if not node or not isinstance(node, dict):
-            return elements
-        
-        tag = node.get("tag", "")
-        children = node.get("children", [])
-        text = node.get("text", "").strip()
-        
-        # Actual headings
-        if tag in self.HEADING_TAGS:
-            heading_text = self._get_node_text(node)
-            if heading_text:
-                level = int(tag[1])
-                elements.append({
-                    "_type": "heading",
-                    "level": level,
-                    "text": heading_text,
-                })
-            return elements
-        
-        # Line breaks indicate content separation
-        if tag == "br":
-            elements.append({"_type": "line_break"})
-            return elements
-        
-        # Lists
-        if tag in self.LIST_CONTAINER_TAGS:
-            items = self._extract_list_items(node)
-            # Filter out items that were already extracted
-            items = [item for item in items if item.lower().strip() not in extracted_texts]
-            if items:
-                elements.append({
-                    "_type": "list",
-                    "items": items,
-                })
-            return elements
-        
-        # Paragraphs - check for bold pseudo-heading pattern
-        if tag == "p":
-            # Check if this paragraph's content was already extracted
-            full_text = self._get_node_text(node)
-            if full_text and full_text.lower().strip() in extracted_texts:
-                return elements  # Skip, already extracted
+        elements: list[FlatElement] = []
+        
+        # Walk in document order with an explicit stack. Besides nodes, the stack
+        # holds elements that must be emitted after a node's children.
+        stack: list[Any] = [node]
+        heading_tags, list_tags = self.HEADING_TAGS, self.LIST_CONTAINER_TAGS
+        block_tags, bold_tags = self.BLOCK_TAGS, self.BOLD_TAGS
+        get_text = self._get_node_text
+        extract_list_items = self._extract_list_items
+        analyze_paragraph = self._analyze_paragraph
+        analyze_block = self._analyze_block
+        is_standalone_bold_header = self._is_standalone_bold_header
+        while stack:
+            node = stack.pop()
+            if isinstance(node, FlatElement):
+                elements.append(node)
+                continue
             
-            elem = self._analyze_paragraph(node)
-            if elem:
-                # If it's a key_value_extracted marker, mark it but don't add content
-                if elem.get("_type") == "key_value_extracted":
-                    elements.append(elem)
-                # Skip paragraphs whose content was already extracted
-                elif elem.get("text", "").lower().strip() not in extracted_texts:
-                    elements.append(elem)
-            return elements
-        
-        # Block-level elements - check for bold at start
-        if tag in self.BLOCK_TAGS:
-            block_elements = self._analyze_block(node, extracted_texts)
-            elements.extend(block_elements)
-            return elements
-        
-        # Standalone bold/strong that could be a header
-        if tag in self.BOLD_TAGS:
-            bold_text = self._get_node_text(node)
-            if bold_text and self._is_standalone_bold_header(node, bold_text):
-                # Don't add as header if it's already been extracted as a key label
-                if bold_text.lower().strip() not in extracted_texts:
-                    elements.append({
-                        "_type": "bold_header",
-                        "text": bold_text,
-                    })
-            return elements
-        
-        # Recurse into children
-        for child in children:
-            elements.extend(self._flatten_to_elements(child, extracted_texts, depth + 1))
-        
-        # Handle any direct text content
-        if text and tag not in self.HEADING_TAGS:
-            if text.lower().strip() not in extracted_texts:
-                elements.append({
-                    "_type": "text",
-                    "text": text,
-                })
+            if not node or not isinstance(node, dict):
+                continue
+            
+            tag = node.get("tag", "")
+            
+            # Actual headings
+            if tag in heading_tags:
+                heading_text = get_text(node)
+                if heading_text:
+                    level = int(tag[1])
+                    elements.append(FlatElement("heading", heading_text, level=level))
+                continue
+            
+            # Line breaks indicate content separation
+            if tag == "br":
+                elements.append(FlatElement("line_break"))
+                continue
+            
+            # Lists
+            if tag in list_tags:
+                items = extract_list_items(node)
+                # Filter out items that were already extracted
+                items = [item for item in items if _norm(item) not in extracted_texts]
+                if items:
+                    elements.append(FlatElement("list", items=items))
+                continue
+            
+            # Paragraphs - check for bold pseudo-heading pattern
+            if tag == "p":
+                # Check if this paragraph's content was already extracted
+                full_text = get_text(node)
+                if full_text and _norm(full_text) in extracted_texts:
+                    continue  # Skip, already extracted
+                
+                elem = analyze_paragraph(node)
+                if elem:
+                    # If it's a key_value_extracted marker, mark it but don't add content
+                    if elem.kind == "key_value_extracted":
+                        elements.append(elem)
+                    # Skip paragraphs whose content was already extracted
+                    elif elem.norm not in extracted_texts:
+                        elements.append(elem)
+                continue
+            
+            # Block-level elements - check for bold at start
+            if tag in block_tags:
+                analyze_block(node, extracted_texts, elements, stack)
+                continue
+            
+            # Standalone bold/strong that could be a header
+            if tag in bold_tags:
+                bold_text = get_text(node)
+                if bold_text and is_standalone_bold_header(node, bold_text):
+                    # Don't add as header if it's already been extracted as a key label
+                    if _norm(bold_text) not in extracted_texts:
+                        elements.append(FlatElement("bold_header", bold_text))
+                continue
+            
+            # Any direct text content follows the children
+            text = node.get("text", "").strip()
+            if text and _norm(text) not in extracted_texts:
+                stack.append(FlatElement("text", text))
+            
+            # Recurse into children
+            stack.extend(reversed(node.get("children") or ()))
         
         return elements
 
-    def _analyze_paragraph(self, node: dict[str, Any]) -> Optional[dict]:
+    def _analyze_paragraph(self, node: dict[str, Any]) -> Optional[FlatElement]:
         """
         Analyze a paragraph to determine its type:
         - bold_header: <p><strong>Header Text</strong></p>
@@ -1714,6 +1836,11 @@ class DOMContentExtractor:
             bold_child = children[0]
             bold_text = self._get_node_text(bold_child).strip()
             
+            # Case 1: Bold with colon = key-value (handled in phase 1)
+            # Mark as extracted so we don't duplicate
+            if bold_text.endswith(":"):
+                return FlatElement("key_value_extracted", bold_text.rstrip(":").strip())
+            
             # Get remaining content after the bold
             remaining_parts = []
             if text:
@@ -1724,55 +1851,43 @@ class DOMContentExtractor:
                     remaining_parts.append(child_text)
             remaining = " ".join(remaining_parts).strip()
             
-            # Case 1: Bold with colon = key-value (handled in phase 1)
-            # Mark as extracted so we don't duplicate
-            if bold_text.endswith(":"):
-                return {
-                    "_type": "key_value_extracted",
-                    "label": bold_text.rstrip(":").strip(),
-                }
-            
             # Case 2: Bold only, no remaining text = potential header
-            elif not remaining or len(remaining) < 10:
+            if not remaining or len(remaining) < 10:
                 if self._looks_like_section_heading(bold_text):
-                    return {
-                        "_type": "bold_header",
-                        "text": bold_text,
-                    }
+                    return FlatElement("bold_header", bold_text)
                 # Short remaining text but bold isn't a heading - treat as paragraph
                 elif remaining:
-                    return {
-                        "_type": "paragraph",
-                        "text": f"{bold_text} {remaining}".strip(),
-                    }
+                    return FlatElement("paragraph", f"{bold_text} {remaining}".strip())
             
             # Case 3: Bold followed by significant text = paragraph with inline emphasis
             # This is NOT a header, just emphasis within flowing text
             else:
                 full_text = f"{bold_text} {remaining}".strip()
-                return {
-                    "_type": "paragraph",
-                    "text": full_text,
-                    "has_inline_emphasis": True,  # Mark that bold is inline, not structural
-                }
+                # Mark that bold is inline, not structural
+                return FlatElement("paragraph", full_text, inline_emphasis=True)
         
         # Regular paragraph
         full_text = self._get_node_text(node)
         if full_text:
-            return {
-                "_type": "paragraph",
-                "text": full_text,
-            }
+            return FlatElement("paragraph", full_text)
         
         return None
 
-    def _analyze_block(self, node: dict[str, Any], extracted_texts: set[str]) -> list[dict]:
+    def _analyze_block(
+        self,
+        node: dict[str, Any],
+        extracted_texts: set[str],
+        elements: list[FlatElement],
+        stack: list[Any]
+    ) -> None:
         """
         Analyze a block element (div, section, etc.) for structure.
         Content found in this block stays within this block's scope.
+        
+        Leading elements are emitted straight into elements; children and anything
+        that follows them are pushed onto the _flatten_to_elements stack.
         """
-        elements = []
-        children = node.get("children", [])
+        children = node.get("children") or []
         text = node.get("text", "").strip()
         
         # Check if block starts with bold as a header
@@ -1798,40 +1913,29 @@ class DOMContentExtractor:
             # Bold with colon at block start = key-value line
             if bold_text.endswith(":") and not has_break_after:
                 # Handled in phase 1, mark as extracted
-                elements.append({
-                    "_type": "key_value_extracted",
-                    "label": bold_text.rstrip(":").strip(),
-                })
-                return elements
+                elements.append(FlatElement("key_value_extracted", bold_text.rstrip(":").strip()))
+                return
             
             # Bold followed by break or block = header for this container only
             elif (has_break_after or remaining_starts_new_block or len(children) == 1) and self._looks_like_section_heading(bold_text):
                 # Don't add if already extracted
-                if bold_text.lower().strip() not in extracted_texts:
-                    elements.append({
-                        "_type": "bold_header",
-                        "text": bold_text,
-                        "scoped": True,  # Mark as scoped to this container
-                    })
+                if _norm(bold_text) not in extracted_texts:
+                    # Mark as scoped to this container
+                    elements.append(FlatElement("bold_header", bold_text, scoped=True))
+                
+                # Mark end of scoped section, after the remaining children
+                stack.append(FlatElement("scope_end"))
                 
                 # Process remaining children within this container
                 start_idx = 2 if has_break_after else 1
-                for child in children[start_idx:]:
-                    elements.extend(self._flatten_to_elements(child, extracted_texts))
-                
-                # Mark end of scoped section
-                elements.append({"_type": "scope_end"})
-                
-                return elements
+                stack.extend(reversed(children[start_idx:]))
+                return
         
         # No special pattern, recurse normally
-        for child in children:
-            elements.extend(self._flatten_to_elements(child, extracted_texts))
+        if text and _norm(text) not in extracted_texts:
+            stack.append(FlatElement("text", text))
         
-        if text and text.lower().strip() not in extracted_texts:
-            elements.append({"_type": "text", "text": text})
-        
-        return elements
+        stack.extend(reversed(children))
 
     def _is_standalone_bold_header(self, node: dict[str, Any], text: str) -> bool:
         """
@@ -1851,7 +1955,7 @@ class DOMContentExtractor:
         
         return True
 
-    def _build_sections_from_elements(self, elements: list[dict], extracted_texts: set[str]) -> list[StructuredSection]:
+    def _build_sections_from_elements(self, elements: list[FlatElement]) -> list[StructuredSection]:
         """
         Build structured sections from flattened elements.
         Respects container scoping for bold headers.
@@ -1861,7 +1965,7 @@ class DOMContentExtractor:
         in_scoped_section = False
         
         for elem in elements:
-            elem_type = elem.get("_type")
+            elem_type = elem.kind
             
             # Track key-values that were already extracted in phase 1
             if elem_type == "key_value_extracted":
@@ -1883,7 +1987,7 @@ class DOMContentExtractor:
                 
                 # Start new section (not scoped - captures until next heading)
                 current_section = StructuredSection(
-                    heading=elem.get("text", "")
+                    heading=elem.text
                 )
                 in_scoped_section = False
             
@@ -1895,15 +1999,14 @@ class DOMContentExtractor:
                 
                 # Start new section
                 current_section = StructuredSection(
-                    heading=elem.get("text", "")
+                    heading=elem.text
                 )
                 # Check if this is a scoped section (only captures content in same container)
-                in_scoped_section = elem.get("scoped", False)
+                in_scoped_section = elem.scoped
             
             elif elem_type == "list":
-                items = elem.get("items", [])
-                # Filter out already extracted items
-                items = [item for item in items if item.lower().strip() not in extracted_texts]
+                # Items were filtered against extracted_texts when the element was built
+                items = elem.items or []
                 if items:
                     if current_section:
                         current_section.content.extend(items)
@@ -1913,8 +2016,9 @@ class DOMContentExtractor:
                         current_section.content.extend(items)
             
             elif elem_type in ("paragraph", "text"):
-                text = elem.get("text", "")
-                if text and text.lower().strip() not in extracted_texts:
+                text = elem.text
+                # Already checked against extracted_texts when the element was built
+                if text:
                     # If we're in a scoped section, content goes there
                     # If not, content goes to current section or starts new anonymous section
                     if current_section:
@@ -1943,26 +2047,35 @@ class DOMContentExtractor:
                 if "_content" not in result:
                     result["_content"] = []
                 for content in section.content:
-                    if content.lower().strip() not in extracted_texts:
+                    norm = _norm(content)
+                    if norm not in extracted_texts:
                         result["_content"].append(content)
-                        extracted_texts.add(content.lower().strip())
+                        extracted_texts.add(norm)
             return
         
         heading = section.heading.rstrip(":").strip()
         
         # Skip if already exists with same or more content
-        if heading in result:
-            existing = result[heading]
+        existing = result.get(heading)
+        if existing is not None:
             new_content = section.content
             if isinstance(existing, list) and isinstance(new_content, list):
                 if len(existing) >= len(new_content):
                     return
             elif isinstance(existing, str) and isinstance(new_content, list):
-                if len(existing) >= len(" ".join(new_content)):
+                # Length of " ".join(new_content), without building the string
+                joined_len = sum(map(len, new_content)) + len(new_content) - 1
+                if len(existing) >= joined_len:
                     return
         
         # Filter content that was already extracted
-        filtered_content = [c for c in section.content if c.lower().strip() not in extracted_texts]
+        filtered_norms = []
+        filtered_content = []
+        for c in section.content:
+            norm = _norm(c)
+            if norm not in extracted_texts:
+                filtered_norms.append(norm)
+                filtered_content.append(c)
         
         if not filtered_content:
             return
@@ -1970,14 +2083,12 @@ class DOMContentExtractor:
         # Add section content
         if len(filtered_content) == 1:
             result[heading] = filtered_content[0]
-            extracted_texts.add(filtered_content[0].lower().strip())
-        elif filtered_content:
+        else:
             result[heading] = filtered_content
-            for c in filtered_content:
-                extracted_texts.add(c.lower().strip())
+        extracted_texts.update(filtered_norms)
         
         # Track the heading
-        extracted_texts.add(heading.lower().strip())
+        extracted_texts.add(_norm(heading))
         
         # Merge key-values
         for k, v in section.key_values.items():
@@ -1992,7 +2103,26 @@ class DOMContentExtractor:
         Capture any content not already in result.
         Uses word-level overlap detection to avoid duplicates.
         """
-        all_text_blocks = self._collect_all_text_blocks(node)
+        all_text_blocks = self._collect_all_text_blocks(node, extracted_texts)
+        
+        # Index captured texts by word so the overlap check only visits texts
+        # sharing at least one word with the block. Very short captured texts
+        # are never compared.
+        caps: list[str] = []
+        cap_word_sets: list[set[str]] = []
+        word_to_caps: dict[str, list[int]] = {}
+        
+        def index_cap(cap: str) -> None:
+            if len(cap) < 10:
+                return
+            words = set(cap.split())
+            for word in words:
+                word_to_caps.setdefault(word, []).append(len(caps))
+            caps.append(cap)
+            cap_word_sets.append(words)
+        
+        for cap in extracted_texts:
+            index_cap(cap)
         
         # Find uncaptured content
         uncaptured = []
@@ -2006,26 +2136,18 @@ class DOMContentExtractor:
             if block_lower in extracted_texts:
                 continue
             
-            # Check for significant word overlap
-            block_words = set(block_lower.split())
-            is_captured = False
+            # Check for substring match
+            is_captured = any(block_lower in cap or cap in block_lower for cap in caps)
             
-            for cap in extracted_texts:
-                # Skip very short captured texts for comparison
-                if len(cap) < 10:
-                    continue
-                
-                cap_words = set(cap.split())
-                
-                # Check for substring match
-                if block_lower in cap or cap in block_lower:
-                    is_captured = True
-                    break
-                
-                # Check for significant word overlap (>70% of words match)
-                if block_words and cap_words:
+            # Check for significant word overlap (>70% of words match)
+            if not is_captured:
+                block_words = set(block_lower.split())
+                block_word_count = len(block_words)
+                candidates = {i for word in block_words for i in word_to_caps.get(word, ())}
+                for i in candidates:
+                    cap_words = cap_word_sets[i]
                     common_words = block_words & cap_words
-                    overlap_ratio = len(common_words) / min(len(block_words), len(cap_words))
+                    overlap_ratio = len(common_words) / min(block_word_count, len(cap_words))
                     if overlap_ratio > 0.7:
                         is_captured = True
                         break
@@ -2033,37 +2155,56 @@ class DOMContentExtractor:
             if not is_captured:
                 uncaptured.append(block_clean)
                 extracted_texts.add(block_lower)
+                index_cap(block_lower)
         
         if uncaptured:
             if "_additional_content" not in result:
                 result["_additional_content"] = []
             result["_additional_content"].extend(uncaptured)
 
-    def _collect_all_text_blocks(self, node: dict[str, Any]) -> list[str]:
+    def _collect_all_text_blocks(self, node: dict[str, Any], extracted_texts: set[str]) -> list[str]:
         """
         Collect all text blocks from the DOM.
+        
+        Skips subtrees whose full text, as already computed by an earlier phase,
+        is itself captured: every block inside would match it as a substring.
         """
         blocks = []
-        
-        if not node or not isinstance(node, dict):
-            return blocks
-        
-        tag = node.get("tag", "")
-        
-        # Skip certain tags
-        if tag in ("script", "style", "nav", "footer", "header"):
-            return blocks
-        
-        # For paragraphs and list items, get full text
-        if tag in ("p", "li"):
-            text = self._get_node_text(node)
-            if text and len(text) > 10:  # Skip very short fragments
-                blocks.append(text)
-            return blocks
-        
-        # Recurse
-        for child in node.get("children", []):
-            blocks.extend(self._collect_all_text_blocks(child))
+        text_cache = self._text_cache
+        position, ends, inner_counts = self._flat_position, self._flat_ends, self._flat_inner_counts
+        
+        # Walk in document order with an explicit stack
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if not node or not isinstance(node, dict):
+                continue
+            
+            tag = node.get("tag", "")
+            
+            # Skip certain tags
+            if tag in ("script", "style", "nav", "footer", "header"):
+                continue
+            
+            # For paragraphs and list items, get full text
+            if tag in ("p", "li"):
+                text = self._get_node_text(node)
+                if text and len(text) > 10:  # Skip very short fragments
+                    blocks.append(text)
+                continue
+            
+            # Skip subtrees already captured whole. innerText anywhere inside breaks
+            # the guarantee that child text appears verbatim in the combined text.
+            full_text = text_cache.get(id(node))
+            if full_text:
+                i = position.get(id(node))
+                if i is not None and inner_counts[ends[i]] == inner_counts[i]:
+                    norm = _norm(full_text)
+                    if len(norm) >= 10 and norm in extracted_texts:
+                        continue
+            
+            # Recurse
+            stack.extend(reversed(node.get("children") or ()))
         
         return blocks
 
@@ -2076,15 +2217,22 @@ class DOMContentExtractor:
         if not node or not isinstance(node, dict):
             return ""
         
+        key = id(node)
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            return cached
+        
         # Prefer innerText if available (it's already in correct order)
         if inner := node.get("innerText", "").strip():
+            self._text_cache[key] = inner
             return inner
         
         parts = []
+        get_text = self._get_node_text
         
         # First, get text from children (they appear first in DOM order typically)
         for child in node.get("children", []):
-            child_text = self._get_node_text(child)
+            child_text = get_text(child)
             if child_text:
                 parts.append(child_text)
         
@@ -2093,7 +2241,9 @@ class DOMContentExtractor:
         if text := node.get("text", "").strip():
             parts.append(text)
         
-        return " ".join(parts).strip()
+        combined = " ".join(parts).strip()
+        self._text_cache[key] = combined
+        return combined
 
     def _get_text_or_list(self, node: dict[str, Any]) -> Any:
         """Get text or extract as list if node contains ul/ol."""
@@ -2113,16 +2263,27 @@ class DOMContentExtractor:
 
     def _extract_list_items(self, list_node: dict[str, Any]) -> list[str]:
         """Extract all li items from ul/ol."""
-        items = []
-        for child in list_node.get("children", []):
-            if child.get("tag") == "li":
-                text = self._get_node_text(child)
-                if text:
-                    items.append(text)
-        return items
+        key = id(list_node)
+        cached = self._list_items_cache.get(key)
+        if cached is None:
+            get_text = self._get_node_text
+            cached = self._list_items_cache[key] = [
+                text
+                for child in list_node.get("children") or ()
+                if child.get("tag") == "li" and (text := get_text(child))
+            ]
+        # Callers keep and extend the returned list, so hand out a copy
+        return list(cached)
 
     def _is_likely_label(self, text: str) -> bool:
-        """Check if text looks like a field label, not a sentence."""
+        """Check if text looks like a field label, not a sentence (memoized per extraction)."""
+        cached = self._label_cache.get(text)
+        if cached is None:
+            cached = self._label_cache[text] = self._check_likely_label(text)
+        return cached
+
+    def _check_likely_label(self, text: str) -> bool:
+        """Uncached body of _is_likely_label."""
         if not text:
             return False
         
@@ -2130,24 +2291,19 @@ class DOMContentExtractor:
         text_lower = text_clean.lower()
         
         # Check against known labels first
-        for label in self.COMMON_JOB_LABELS:
-            if label in text_lower or text_lower in label:
-                return True
+        if (
+            text_lower in self.COMMON_JOB_LABELS
+            or self._COMMON_JOB_LABELS_RE.search(text_lower)
+            or text_lower in self._COMMON_JOB_LABELS_BLOB
+        ):
+            return True
         
         # Reject if starts with sentence-like patterns
-        sentence_starters = (
-            "this ", "that ", "these ", "those ", "there ", "here ",
-            "it ", "he ", "she ", "they ", "we ", "i ", "you ",
-            "the ", "a ", "an ", "my ", "your ", "his ", "her ", "our ", "their ",
-            "if ", "when ", "while ", "after ", "before ", "because ", "since ",
-            "what ", "how ", "why ", "where ", "who ", "which ",
-        )
-        if any(text_lower.startswith(s) for s in sentence_starters):
+        if _starts_with_word(text_lower, _SENTENCE_STARTERS):
             return False
         
         # Reject if contains common verbs that suggest it's a sentence
-        sentence_verbs = (" is ", " are ", " was ", " were ", " has ", " have ", " had ", " will ", " would ", " should ", " could ", " can ")
-        if any(v in text_lower for v in sentence_verbs):
+        if _SENTENCE_VERB_RE.search(text_lower):
             return False
         
         # Short text with few words is more likely to be a label
@@ -2158,16 +2314,25 @@ class DOMContentExtractor:
         return False
 
     def _looks_like_section_heading(self, text: str) -> bool:
-        """Check if text looks like a section heading."""
+        """Check if text looks like a section heading (memoized per extraction)."""
+        cached = self._heading_cache.get(text)
+        if cached is None:
+            cached = self._heading_cache[text] = self._check_section_heading(text)
+        return cached
+
+    def _check_section_heading(self, text: str) -> bool:
+        """Uncached body of _looks_like_section_heading."""
         if not text:
             return False
         
         text_lower = text.lower().strip()
         
         # Check against known headings
-        for heading in self.COMMON_SECTION_HEADINGS:
-            if heading in text_lower or text_lower in heading:
-                return True
+        if (
+            self._COMMON_SECTION_HEADINGS_RE.search(text_lower)
+            or text_lower in self._COMMON_SECTION_HEADINGS_BLOB
+        ):
+            return True
         
         # Heuristics for headings
         if len(text) > 100:
@@ -2192,26 +2357,22 @@ class DOMContentExtractor:
             return
         
         # Clean label
-        label = label.rstrip(":").strip()
-        label = " ".join(label.split())
+        label = _norm_label(label)
         
         if not label:
             return
         
-        # Handle existing value
-        if label in result:
-            existing = result[label]
-            # Keep longer/more detailed value
-            if isinstance(existing, str) and isinstance(value, str):
-                if len(value) > len(existing):
-                    result[label] = value
-            elif isinstance(existing, list) and isinstance(value, list):
-                if len(value) > len(existing):
-                    result[label] = value
-            # Keep existing if same type and same/longer
-            return
-        
-        result[label] = value
+        # Handle existing value (stored values are never None)
+        existing = result.get(label)
+        if existing is None:
+            result[label] = value
+        # Keep longer/more detailed value; keep existing if same/longer or types differ
+        elif isinstance(existing, str) and isinstance(value, str):
+            if len(value) > len(existing):
+                result[label] = value
+        elif isinstance(existing, list) and isinstance(value, list):
+            if len(value) > len(existing):
+                result[label] = value
 
     def _cleanup_structured_result(self, result: dict[str, Any]) -> dict[str, Any]:
         """Clean up the final result."""
@@ -2250,20 +2411,24 @@ class DOMContentExtractor:
         if not children or len(children) <= 5:
             return False
         
-        span_count = 0
-        short_text_count = 0
-        
-        for child in children:
-            if not isinstance(child, dict):
-                continue
-            if child.get("tag") == "span":
-                span_count += 1
-                text = child.get("text", "") or child.get("innerText", "")
-                if len(text.strip()) < 20:
-                    short_text_count += 1
+        spans = [c for c in children if isinstance(c, dict) and c.get("tag") == "span"]
+        span_count = len(spans)
+        if span_count < 3:
+            return False
         
-        if span_count >= 3 and short_text_count / max(span_count, 1) > 0.5:
-            return True
+        # Decide as soon as short spans hold, or can no longer reach, a majority
+        short_text_count = 0
+        long_text_count = 0
+        for span in spans:
+            text = span.get("text", "") or span.get("innerText", "")
+            if len(text.strip()) < 20:
+                short_text_count += 1
+                if short_text_count * 2 > span_count:
+                    return True
+            else:
+                long_text_count += 1
+                if long_text_count * 2 >= span_count:
+                    return False
         
         return False
 
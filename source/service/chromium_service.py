@@ -1,5 +1,4 @@
 import asyncio
-import os
 import shutil
 import subprocess
 import tempfile
@@ -85,32 +84,21 @@ class ChromeCDPManager:
             extra={"search_paths": self.config.chrome_paths},
         )
         for path in self.config.chrome_paths:
-            if not os.path.exists(path) and path not in ["chrome", "chromium"]:
+            # shutil.which resolves bare names on PATH and checks that absolute
+            # paths are executable files, without spawning the browser
+            resolved = shutil.which(path)
+            if resolved is None:
                 logger.debug(
                     "Chrome path does not exist",
                     extra={"path": path},
                 )
                 continue
 
-            try:
-                proc = await asyncio.create_subprocess_exec(
-                    path,
-                    "--version",
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-                await proc.wait()
-                logger.info(
-                    "Chrome executable found",
-                    extra={"path": path},
-                )
-                return path
-            except Exception as e:
-                logger.debug(
-                    "Failed to verify Chrome executable",
-                    extra={"path": path, "error": str(e)},
-                )
-                continue
+            logger.info(
+                "Chrome executable found",
+                extra={"path": resolved},
+            )
+            return resolved
 
         logger.error("Chrome executable not found in any search path")
         raise RuntimeError("Chrome not found. Please install Chrome or Chromium.")
@@ -124,28 +112,27 @@ class ChromeCDPManager:
             },
         )
         timeout = aiohttp.ClientTimeout(total=self.config.health_check_timeout)
-
-        for attempt in range(self.config.startup_timeout):
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        f"{self.cdp_url}/json/version",
-                        timeout=timeout,
-                    ) as response:
+        version_url = f"{self.cdp_url}/json/version"
+
+        # One session for all polls so the connector and its keep-alive
+        # connection are reused instead of rebuilt every interval
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            for attempt in range(self.config.startup_timeout):
+                try:
+                    async with session.get(version_url) as response:
                         if response.status == 200:
                             logger.info(
                                 "CDP is ready",
                                 extra={"cdp_url": self.cdp_url, "attempts": attempt + 1},
                             )
                             return True
-            except Exception as e:
-                logger.debug(
-                    "CDP health check failed, retrying",
-                    extra={"attempt": attempt + 1, "error": str(e)},
-                )
-                pass
+                except Exception as e:
+                    logger.debug(
+                        "CDP health check failed, retrying",
+                        extra={"attempt": attempt + 1, "error": str(e)},
+                    )
 
-            await asyncio.sleep(self.config.health_check_interval)
+                await asyncio.sleep(self.config.health_check_interval)
 
         logger.error(
             "CDP failed to become ready within timeout",
@@ -1,17 +1,37 @@
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional
+import asyncio
 import json 
+import random
 from utils.llm_prompt import (
     create_job_page_analysis_prompt,
     create_job_page_analysis_prompt_detail, get_job_extraction_prompt
 )
-from openai import OpenAI
+from openai import (
+    AsyncOpenAI,
+    AuthenticationError,
+    BadRequestError,
+    NotFoundError,
+    PermissionDeniedError,
+)
 from utils.logging import setup_logger
 
 # Configure logging
 logger = setup_logger(__name__)
 
+_MAX_ATTEMPTS = 2
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+
+# Errors that will fail the same way on every attempt, so retrying only burns quota
+_FATAL_API_ERRORS = (AuthenticationError, BadRequestError, NotFoundError, PermissionDeniedError)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given zero-based attempt."""
+    return min(_RETRY_BASE_DELAY * 2 ** attempt, _RETRY_MAX_DELAY) + random.uniform(0, _RETRY_BASE_DELAY)
+
 
 # =============================================================================
 # Assuming these are imported from your existing modules:
@@ -40,7 +60,7 @@ class AnalysisResult:
 
 class JobPageAnalyzer:
     def __init__(self, api_key: str, model: str = "gpt-4.1-nano"):
-        self._client = OpenAI(api_key=api_key)
+        self._client = AsyncOpenAI(api_key=api_key)
         self._model = model
         logger.debug(
             "JobPageAnalyzer initialized",
@@ -79,13 +99,13 @@ class JobPageAnalyzer:
         )
 
         error = ""
-        for i in range(2):
+        for i in range(_MAX_ATTEMPTS):
             logger.debug(
                 "Attempting API call",
-                extra={"attempt": i + 1, "max_attempts": 2},
+                extra={"attempt": i + 1, "max_attempts": _MAX_ATTEMPTS},
             )
             try:
-                response = self._client.responses.create(
+                response = await self._client.responses.create(
                     model=self._model,
                     input=prompt,
                 )
@@ -131,20 +151,23 @@ class JobPageAnalyzer:
                     "Analysis API call failed",
                     extra={
                         "attempt": i + 1,
-                        "max_attempts": 2,
+                        "max_attempts": _MAX_ATTEMPTS,
                         "error": str(e),
                         "url": url,
                     },
                 )
                 error = e
-                continue
+                if isinstance(e, _FATAL_API_ERRORS):
+                    break
+                if i + 1 < _MAX_ATTEMPTS:
+                    await asyncio.sleep(_retry_delay(i))
 
         logger.error(
             "Page analysis failed after all retries",
             extra={
                 "url": url,
                 "error": str(error),
-                "attempts": 2,
+                "attempts": i + 1,
             },
         )
         return AnalysisResult(
@@ -198,13 +221,13 @@ class JobPageAnalyzer:
                 )
 
         error = ""
-        for i in range(2):
+        for i in range(_MAX_ATTEMPTS):
             logger.debug(
                 "Attempting API call for data analysis",
-                extra={"attempt": i + 1, "max_attempts": 2},
+                extra={"attempt": i + 1, "max_attempts": _MAX_ATTEMPTS},
             )
             try:
-                response = self._client.responses.create(
+                response = await self._client.responses.create(
                     model=self._model,
                     input=prompt,
                 )
@@ -231,18 +254,21 @@ class JobPageAnalyzer:
                     "Data analysis API call failed",
                     extra={
                         "attempt": i + 1,
-                        "max_attempts": 2,
+                        "max_attempts": _MAX_ATTEMPTS,
                         "error": str(e),
                     },
                 )
                 error = e
-                continue
+                if isinstance(e, _FATAL_API_ERRORS):
+                    break
+                if i + 1 < _MAX_ATTEMPTS:
+                    await asyncio.sleep(_retry_delay(i))
 
         logger.error(
             "Data analysis failed after all retries",
             extra={
                 "error": str(error),
-                "attempts": 2,
+                "attempts": i + 1,
             },
         )
         return AnalysisResult(
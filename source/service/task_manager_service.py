@@ -7,7 +7,7 @@ import asyncio
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
-import uuid
+import secrets
 
 from pymongo import MongoClient, ASCENDING, DESCENDING
 from pymongo.errors import ConnectionFailure
@@ -91,11 +91,11 @@ class TaskManager:
     
     def generate_batch_id(self) -> str:
         """Generate unique batch ID"""
-        return f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        return f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{secrets.token_hex(4)}"
     
     def generate_task_id(self) -> str:
         """Generate unique task ID"""
-        return f"task_{uuid.uuid4().hex[:12]}"
+        return f"task_{secrets.token_hex(6)}"
     
     async def create_batch(
         self,
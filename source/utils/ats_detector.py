@@ -187,7 +187,13 @@ class ATSDetector:
         base_domain = cls.extract_base_domain(url)
         full_domain = cls.extract_full_domain(url)
 
-        for ats_domain in cls.KNOWN_ATS_DOMAINS:
+        # Probe the full domain and each of its parent domains (most specific first)
+        # against the known set, instead of scanning every known provider
+        candidates = [full_domain]
+        candidates.extend(full_domain[i + 1:] for i, ch in enumerate(full_domain) if ch == ".")
+        for ats_domain in candidates:
+            if ats_domain not in cls.KNOWN_ATS_DOMAINS:
+                continue
             if base_domain == ats_domain:
                 logger.debug(
                     "ATS match found via base domain",
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import  Optional
 from urllib.parse import urlparse
 from playwright.async_api import  Page
@@ -11,6 +12,25 @@ import tldextract
 # Configure logging
 logger = setup_logger(__name__)
 
+_WORD_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=128)
+def _compile_keywords(keywords: frozenset[str]) -> tuple[frozenset[str], tuple[re.Pattern, ...]]:
+    """
+    Split keywords into plain words and \\b-anchored patterns for the rest.
+    
+    A keyword made only of word characters matches a URL exactly when it equals one
+    of the URL's maximal word runs, so those are scored by set intersection.
+    Results are cached per keyword set, so repeated calls with the same custom
+    keywords compile their patterns once per process.
+    """
+    words = frozenset(kw for kw in keywords if _WORD_RE.fullmatch(kw))
+    patterns = tuple(
+        re.compile(rf"\b{re.escape(kw)}\b") for kw in keywords if kw not in words
+    )
+    return words, patterns
+
 
 
 # =============================================================================
@@ -27,6 +47,8 @@ class URLFilter:
         "join", "apply", "application", "talent",
         "team", "work", "working", "people", "peoples", "about"
     })
+    # DEFAULT_JOB_KEYWORDS split for scoring, computed once at import
+    _DEFAULT_KEYWORD_MATCHERS = _compile_keywords(DEFAULT_JOB_KEYWORDS)
 
     SKIP_EXTENSIONS = frozenset({
         ".pdf", ".doc", ".docx", ".xls", ".xlsx",
@@ -67,7 +89,10 @@ class URLFilter:
         skipped_count = 0
         for url in urls:
             url_lower = url.lower().split("?")[0]
-            if not any(url_lower.endswith(ext) for ext in cls.SKIP_EXTENSIONS):
+            # Extensions are single dot-free suffixes, so one set probe on the
+            # last ".xxx" segment replaces an endswith() per extension
+            _, dot, ext = url_lower.rpartition(".")
+            if not (dot and dot + ext in cls.SKIP_EXTENSIONS):
                 filtered.append(url)
             else:
                 skipped_count += 1
@@ -138,7 +163,12 @@ class URLFilter:
         urls: list[str],
         include_keywords: Optional[set[str]] = None,
     ) -> list[str]:
-        keywords = include_keywords or cls.DEFAULT_JOB_KEYWORDS
+        if include_keywords:
+            keywords = include_keywords
+            words, patterns = _compile_keywords(frozenset(keywords))
+        else:
+            keywords = cls.DEFAULT_JOB_KEYWORDS
+            words, patterns = cls._DEFAULT_KEYWORD_MATCHERS
         logger.debug(
             "Filtering job URLs",
             extra={
@@ -151,10 +181,8 @@ class URLFilter:
         for url in urls:
             try:
                 url_lower = url.lower()
-                score = sum(
-                    1 for kw in keywords
-                    if re.search(rf"\b{re.escape(kw)}\b", url_lower)
-                )
+                score = len(words.intersection(_WORD_RE.findall(url_lower))) if words else 0
+                score += sum(1 for pattern in patterns if pattern.search(url_lower))
                 if score > 0:
                     scored.append((url, score))
                     logger.debug(